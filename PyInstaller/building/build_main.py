@@ -675,8 +675,9 @@ class Analysis(Target):
         self.graph.process_post_graph_hooks(self)
 
         # Update 'binaries' and 'datas' TOC lists with entries collected from hooks.
-        self.binaries += self.graph.make_hook_binaries_toc()
-        self.datas += self.graph.make_hook_datas_toc()
+        hook_binaries_toc, hook_datas_toc = self.graph.make_hook_binaries_and_datas_tocs()
+        self.binaries += hook_binaries_toc
+        self.datas += hook_datas_toc
 
         # We do not support zipped eggs anymore (PyInstaller v6.0), so `zipped_data` and `zipfiles` are always empty.
         self.zipped_data = []
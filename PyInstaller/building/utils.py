@@ -10,6 +10,7 @@
 #-----------------------------------------------------------------------------
 
 import fnmatch
+import functools
 import glob
 import hashlib
 import marshal
@@ -122,8 +123,6 @@ def process_collected_binary(
 
     In addition to given arguments, this function also uses CONF['cachedir'] and CONF['upx_dir'].
     """
-    from PyInstaller.config import CONF
-
     # We need to use cache in the following scenarios:
     #  * extra binary processing due to use of `strip` or `upx`
     #  * building on macOS, where we need to rewrite library paths in binaries' headers and (re-)sign the binaries.
@@ -486,10 +485,16 @@ def format_binaries_and_datas(binaries_or_datas, workingdir=None):
         # Normalize paths.
         src_root_path_or_glob = os.path.normpath(src_root_path_or_glob)
         if os.path.isfile(src_root_path_or_glob):
+            # An existing file always matches itself, even if its name contains glob magic characters (see #2314).
             src_root_paths = [src_root_path_or_glob]
-        else:
+        elif any(magic_char in src_root_path_or_glob for magic_char in '*?['):
             # List of the absolute paths of all source paths matching the current glob.
             src_root_paths = glob.glob(src_root_path_or_glob)
+        else:
+            # Fast path: a path without glob magic characters can only match itself, so a single existence check
+            # replaces the pattern compilation and directory scan performed by glob. Use lexists() to match glob's
+            # treatment of symbolic links.
+            src_root_paths = [src_root_path_or_glob] if os.path.lexists(src_root_path_or_glob) else []
 
         if not src_root_paths:
             raise SystemExit(f'Unable to find {src_root_path_or_glob!r} when adding binary and data files.')
@@ -502,11 +507,13 @@ def format_binaries_and_datas(binaries_or_datas, workingdir=None):
                     os.path.normpath(src_root_path),
                 ))
             elif os.path.isdir(src_root_path):
-                for src_dir, src_subdir_basenames, src_file_basenames in os.walk(src_root_path):
-                    # Ensure the current source directory is a subdirectory of the passed top-level source directory.
-                    # Since os.walk() does *NOT* follow symlinks by default, this should be the case. (But let's make
-                    # sure.)
-                    assert src_dir.startswith(src_root_path)
+                # Recurse with an explicit os.scandir() stack instead of os.walk(). The file-vs-directory
+                # classification comes from the cached DirEntry objects, saving a stat per collected file compared
+                # to os.walk() followed by an isfile() check. As with os.walk(), directory symlinks are not followed,
+                # and unreadable subdirectories are silently skipped.
+                src_dirs = [src_root_path]
+                while src_dirs:
+                    src_dir = src_dirs.pop()
 
                     # Relative path of the current target directory, obtained by:
                     #
@@ -516,14 +523,19 @@ def format_binaries_and_datas(binaries_or_datas, workingdir=None):
                     #   "trg/./file").
                     trg_dir = os.path.normpath(os.path.join(trg_root_dir, os.path.relpath(src_dir, src_root_path)))
 
-                    for src_file_basename in src_file_basenames:
-                        src_file = os.path.join(src_dir, src_file_basename)
-                        if os.path.isfile(src_file):
-                            # Normalize the result to remove redundant relative paths (e.g., removing "./" from
-                            # "trg/./file").
-                            toc_datas.add((
-                                os.path.normpath(os.path.join(trg_dir, src_file_basename)), os.path.normpath(src_file)
-                            ))
+                    try:
+                        dir_entries = os.scandir(src_dir)
+                    except OSError:
+                        continue
+
+                    with dir_entries:
+                        for dir_entry in dir_entries:
+                            if dir_entry.is_dir(follow_symlinks=False):
+                                src_dirs.append(dir_entry.path)
+                            elif dir_entry.is_file():
+                                # Normalize the result to remove redundant relative paths (e.g., removing "./" from
+                                # "trg/./file").
+                                toc_datas.add((os.path.normpath(os.path.join(trg_dir, dir_entry.name)), dir_entry.path))
 
     return toc_datas
 
@@ -540,40 +552,51 @@ def get_code_object(modname, filename, optimize):
         # check for None, too, to be forward-compatible.)
         logger.debug('Compiling namespace package %s', modname)
         txt = '#\n'
-        code_object = compile(txt, filename, 'exec', optimize=optimize)
+        return compile(txt, filename, 'exec', optimize=optimize)
+
+    # The same file may be compiled several times within one process (e.g., a runtime hook or module collected into
+    # several archives of a multipackage build). Code objects are immutable, so reuse previously compiled ones; the
+    # file's modification time and size are part of the cache key to invalidate entries when the file changes on disk.
+    file_stat = os.stat(filename)
+    return _compile_code_object(modname, filename, optimize, (file_stat.st_mtime_ns, file_stat.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_code_object(modname, filename, optimize, _stat_key):
+    # `_stat_key` is the (st_mtime_ns, st_size) pair of `filename`; it has no use here other than being part of the
+    # memoization key, so that entries for modified files are not reused.
+    _, ext = os.path.splitext(filename)
+    ext = ext.lower()
+
+    if ext == '.pyc':
+        # The module is available in binary-only form. Read the contents of .pyc file using helper function, which
+        # supports reading from either stand-alone or archive-embedded .pyc files.
+        logger.debug('Reading code object from .pyc file %s', filename)
+        pyc_data = _read_pyc_data(filename)
+        code_object = marshal.loads(pyc_data[16:])
     else:
+        # Assume this is a source .py file, but allow an arbitrary extension (other than .pyc, which is taken in
+        # the above branch). This allows entry-point scripts to have an arbitrary (or no) extension, as tested by
+        # the `test_arbitrary_ext` in `test_basic.py`.
+        logger.debug('Compiling python script/module file %s', filename)
+
+        with open(filename, 'rb') as f:
+            source = f.read()
+
+        # If entry-point script has no suffix, append .py when compiling the source. In POSIX builds, the executable
+        # has no suffix either; this causes issues with `traceback` module, as it tries to read the executable file
+        # when trying to look up the code for the entry-point script (when current working directory contains the
+        # executable).
         _, ext = os.path.splitext(filename)
-        ext = ext.lower()
+        if not ext:
+            logger.debug("Appending .py to compiled entry-point name...")
+            filename += '.py'
 
-        if ext == '.pyc':
-            # The module is available in binary-only form. Read the contents of .pyc file using helper function, which
-            # supports reading from either stand-alone or archive-embedded .pyc files.
-            logger.debug('Reading code object from .pyc file %s', filename)
-            pyc_data = _read_pyc_data(filename)
-            code_object = marshal.loads(pyc_data[16:])
-        else:
-            # Assume this is a source .py file, but allow an arbitrary extension (other than .pyc, which is taken in
-            # the above branch). This allows entry-point scripts to have an arbitrary (or no) extension, as tested by
-            # the `test_arbitrary_ext` in `test_basic.py`.
-            logger.debug('Compiling python script/module file %s', filename)
-
-            with open(filename, 'rb') as f:
-                source = f.read()
-
-            # If entry-point script has no suffix, append .py when compiling the source. In POSIX builds, the executable
-            # has no suffix either; this causes issues with `traceback` module, as it tries to read the executable file
-            # when trying to look up the code for the entry-point script (when current working directory contains the
-            # executable).
-            _, ext = os.path.splitext(filename)
-            if not ext:
-                logger.debug("Appending .py to compiled entry-point name...")
-                filename += '.py'
-
-            try:
-                code_object = compile(source, filename, 'exec', optimize=optimize)
-            except SyntaxError:
-                logger.warning("Sytnax error while compiling %s", filename)
-                raise
+        try:
+            code_object = compile(source, filename, 'exec', optimize=optimize)
+        except SyntaxError:
+            logger.warning("Sytnax error while compiling %s", filename)
+            raise
 
     return code_object
 
@@ -120,6 +120,8 @@ class PyiModuleGraph(ModuleGraph):
         # files or data from another test-case.
         logger.info('Caching module graph hooks...')
         self._hooks = self._cache_hooks("")
+        # Memoized results of _find_all_excluded_imports(); must be reset together with the hook cache above.
+        self._excluded_imports_cache = {}
         self._hooks_pre_safe_import_module = self._cache_hooks('pre_safe_import_module')
         self._hooks_pre_find_module_path = self._cache_hooks('pre_find_module_path')
 
@@ -341,6 +343,10 @@ class PyiModuleGraph(ModuleGraph):
             # Prevent all post-graph hooks run above from being run again by the next iteration.
             self._hooks.remove_modules(*hooked_module_names)
 
+            # Removing hooks changes the sets that _find_all_excluded_imports() collects; drop its memoized results.
+            if hooked_module_names:
+                self._excluded_imports_cache.clear()
+
             # If no post-graph hooks were run, terminate iteration.
             if not hooked_module_names:
                 break
@@ -348,15 +354,28 @@ class PyiModuleGraph(ModuleGraph):
     def _find_all_excluded_imports(self, module_name):
         """
         Collect excludedimports from the hooks of the specified module and all its parents.
-        """
-        excluded_imports = set()
-        while module_name:
-            # Gather excluded imports from hook(s) belonging to the module
-            for module_hook in self._hooks.get(module_name, []):
-                excluded_imports.update(module_hook.excludedimports)
-            # Change module name to the module's parent name
-            module_name = module_name.rpartition('.')[0]
-        return excluded_imports
+
+        Returns a 2-tuple `(excluded_imports, excluded_import_prefixes)`, where `excluded_imports` is the set of
+        exclusion rule names and `excluded_import_prefixes` is the matching tuple of dotted rule prefixes used for
+        submodule matching.
+        """
+        # This runs for the referring module of every processed import statement, and the collected sets only change
+        # when the hook cache does, so memoize the result per module name. The memoized results are dropped whenever
+        # hooks are removed from the cache. The dotted-prefix tuple is derived here as well, so _safe_import_hook does
+        # not have to rebuild it for every import statement.
+        entry = self._excluded_imports_cache.get(module_name)
+        if entry is None:
+            excluded_imports = set()
+            parent_module_name = module_name
+            while parent_module_name:
+                # Gather excluded imports from hook(s) belonging to the module
+                for module_hook in self._hooks.get(parent_module_name, []):
+                    excluded_imports.update(module_hook.excludedimports)
+                # Change module name to the module's parent name
+                parent_module_name = parent_module_name.rpartition('.')[0]
+            entry = (excluded_imports, tuple(excluded_import + '.' for excluded_import in excluded_imports))
+            self._excluded_imports_cache[module_name] = entry
+        return entry
 
     def _safe_import_hook(
         self, target_module_partname, source_module, target_attr_names, level=DEFAULT_IMPORT_LEVEL, edge_attr=None
@@ -365,7 +384,7 @@ class PyiModuleGraph(ModuleGraph):
             # Gather all excluded imports for the referring modules, as well as its parents.
             # For example, we want the excluded imports specified by hook for PIL to be also applied when the referring
             # module is its submodule, PIL.Image.
-            excluded_imports = self._find_all_excluded_imports(source_module.identifier)
+            excluded_imports, excluded_import_prefixes = self._find_all_excluded_imports(source_module.identifier)
 
             # Apply extra processing only if we have any excluded-imports rules
             if excluded_imports:
@@ -389,23 +408,28 @@ class PyiModuleGraph(ModuleGraph):
                 else:
                     base_module_name = target_module_partname
 
-                def _exclude_module(module_name, excluded_imports):
+                # An exclusion rule matches the module of the same name as well as all of its submodules. The helper
+                # below runs once for the base module name plus once per target attribute name; rather than comparing
+                # name segments against each rule in a Python loop, reject non-matching names with two C-level checks
+                # (exact-name membership in the rule set, then str.startswith() with the memoized tuple of dotted rule
+                # prefixes) and resolve the individual rule only on an actual match.
+                def _exclude_module(module_name):
                     """
                     Helper for checking whether given module should be excluded.
                     Returns the name of exclusion rule if module should be excluded, None otherwise.
                     """
-                    module_name_parts = module_name.split('.')
-                    for excluded_import in excluded_imports:
-                        excluded_import_parts = excluded_import.split('.')
-                        match = module_name_parts[:len(excluded_import_parts)] == excluded_import_parts
-                        if match:
-                            return excluded_import
+                    if module_name in excluded_imports:
+                        return module_name
+                    if module_name.startswith(excluded_import_prefixes):
+                        for excluded_prefix in excluded_import_prefixes:
+                            if module_name.startswith(excluded_prefix):
+                                return excluded_prefix[:-1]
                     return None
 
                 # First, check if base module name is to be excluded.
                 # This covers both basic `import a` and `import a.b.c`, as well as `from d import e, f` where base
                 # module `d` is excluded.
-                excluded_import_rule = _exclude_module(base_module_name, excluded_imports)
+                excluded_import_rule = _exclude_module(base_module_name)
                 if excluded_import_rule:
                     logger.debug(
                         "Suppressing import of %r from module %r due to excluded import %r specified in a hook for %r "
@@ -420,7 +444,7 @@ class PyiModuleGraph(ModuleGraph):
                     filtered_target_attr_names = []
                     for target_attr_name in target_attr_names:
                         submodule_name = base_module_name + '.' + target_attr_name
-                        excluded_import_rule = _exclude_module(submodule_name, excluded_imports)
+                        excluded_import_rule = _exclude_module(submodule_name)
                         if excluded_import_rule:
                             logger.debug(
                                 "Suppressing import of %r from module %r due to excluded import %r specified in a hook "
@@ -548,19 +572,18 @@ class PyiModuleGraph(ModuleGraph):
 
         :return: Dict with module name and code object.
         """
-        code_dict = {}
-        mod_types = PURE_PYTHON_MODULE_TYPES
-        for node in self.iter_graph(start=self._top_script_node):
-            # TODO This is terrible. To allow subclassing, types should never be directly compared. Use isinstance()
-            # instead, which is safer, simpler, and accepts sets. Most other calls to type() in the codebase should also
-            # be refactored to call isinstance() instead.
+        # TODO This is terrible. To allow subclassing, types should never be directly compared. Use isinstance()
+        # instead, which is safer, simpler, and accepts sets. Most other calls to type() in the codebase should also
+        # be refactored to call isinstance() instead.
 
-            # get node type e.g. Script
-            mg_type = type(node).__name__
-            if mg_type in mod_types:
-                if node.code:
-                    code_dict[node.identifier] = node.code
-        return code_dict
+        # Compare node type names (e.g. Script) against the supported types, and build the dictionary in a single
+        # comprehension to keep the per-node overhead on this graph-wide scan low.
+        mod_types = PURE_PYTHON_MODULE_TYPES
+        return {
+            node.identifier: node.code
+            for node in self.iter_graph(start=self._top_script_node)
+            if type(node).__name__ in mod_types and node.code
+        }
 
     def _make_toc(self, typecode=None):
         """
@@ -756,13 +779,15 @@ class PyiModuleGraph(ModuleGraph):
         Find modules that import a given **module**.
         """
         co_dict = {}
-        pure_python_module_types = PURE_PYTHON_MODULE_TYPES | {
-            'Script',
-        }
         node = self.find_node(module)
         if node:
-            referrers = self.incoming(node)
-            for r in referrers:
+            pure_python_module_types = PURE_PYTHON_MODULE_TYPES | {
+                'Script',
+            }
+            # Prefix matching self-references and references from `module`'s own submodules, computed once rather than
+            # per referrer.
+            submodule_prefix = module + '.'
+            for r in self.incoming(node):
                 # Under python 3.7 and earlier, if `module` is added to hidden imports, one of referrers ends up being
                 # None, causing #3825. Work around it.
                 if r is None:
@@ -771,7 +796,7 @@ class PyiModuleGraph(ModuleGraph):
                 if type(r).__name__ not in pure_python_module_types:
                     continue
                 identifier = r.identifier
-                if identifier == module or identifier.startswith(module + '.'):
+                if identifier == module or identifier.startswith(submodule_prefix):
                     # Skip self references or references from `modules`'s own submodules.
                     continue
                 # The code object may be None if referrer ends up shadowed by eponymous directory that ends up treated
@@ -868,29 +893,24 @@ class PyiModuleGraph(ModuleGraph):
             if type(node).__name__ == 'Package'
         ]
 
-    def make_hook_binaries_toc(self) -> list:
+    def make_hook_binaries_and_datas_tocs(self) -> tuple:
         """
-        Return the TOC list of binaries collected by hooks."
-        """
-        toc = []
-        for node in self.iter_graph(start=self._top_script_node):
-            module_name = str(node.identifier)
-            for dest_name, src_name in self._additional_files_cache.binaries(module_name):
-                toc.append((dest_name, src_name, 'BINARY'))
+        Return the TOC lists of binaries and data files collected by hooks, as a 2-tuple `(binaries_toc, datas_toc)`.
 
-        return toc
-
-    def make_hook_datas_toc(self) -> list:
-        """
-        Return the TOC list of data files collected by hooks."
+        Both lists are built in a single pass over the flattened module graph, instead of walking it once per list.
         """
-        toc = []
+        binaries_toc = []
+        datas_toc = []
+        additional_files_cache = self._additional_files_cache
         for node in self.iter_graph(start=self._top_script_node):
+            # `node.identifier` might be an instance of `modulegraph.Alias`, hence explicit conversion to `str`.
             module_name = str(node.identifier)
-            for dest_name, src_name in self._additional_files_cache.datas(module_name):
-                toc.append((dest_name, src_name, 'DATA'))
+            for dest_name, src_name in additional_files_cache.binaries(module_name):
+                binaries_toc.append((dest_name, src_name, 'BINARY'))
+            for dest_name, src_name in additional_files_cache.datas(module_name):
+                datas_toc.append((dest_name, src_name, 'DATA'))
 
-        return toc
+        return binaries_toc, datas_toc
 
 
 _cached_module_graph_ = None
@@ -957,6 +977,7 @@ def initialize_modgraph(excludes=(), user_hook_dirs=()):
         # Clear data which does not need to be copied from the cached graph since it will be reset by
         # ``PyiModulegraph._reset()`` anyway.
         _cached_module_graph_._hooks = None
+        _cached_module_graph_._excluded_imports_cache = None
         _cached_module_graph_._hooks_pre_safe_import_module = None
         _cached_module_graph_._hooks_pre_find_module_path = None
 
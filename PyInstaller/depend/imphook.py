@@ -12,10 +12,10 @@
 Code related to processing of import hooks.
 """
 
-import glob
 import os.path
 import sys
 import weakref
+from collections import namedtuple
 
 from PyInstaller import log as logging
 from PyInstaller.building.utils import format_binaries_and_datas
@@ -29,6 +29,21 @@ logger = logging.getLogger(__name__)
 # issue.
 HOOKS_MODULE_NAMES = set()
 
+# Cache of hook directory listings, mapping the absolute path of a hook directory to a 2-tuple
+# "(dir_mtime_ns, hook_files)", where "hook_files" maps the fully-qualified names of hooked modules to the absolute
+# paths of the corresponding hook scripts. Hook directories are repeatedly enumerated when several `ModuleHookCache`
+# instances are created (e.g., when building multiple specs or re-running analysis in the same process); as the
+# listings only depend on the directory contents, they are cached here keyed on the directory's modification time,
+# reducing repeated enumeration to a single `stat()` call per directory.
+_hook_dir_listing_cache = {}
+
+# Filename prefix and suffix of hook scripts ("hook-{module_name}.py"), together with their lengths for slicing the
+# hooked module's name out of a hook script's filename.
+_HOOK_FILE_PREFIX = 'hook-'
+_HOOK_FILE_SUFFIX = '.py'
+_HOOK_FILE_PREFIX_LEN = len(_HOOK_FILE_PREFIX)
+_HOOK_FILE_SUFFIX_LEN = len(_HOOK_FILE_SUFFIX)
+
 
 class ModuleHookCache(dict):
     """
@@ -47,6 +62,10 @@ class ModuleHookCache(dict):
         `hook_module_name_prefix` parameter passed to the `ModuleHook.__init__()` method.
     """
 
+    # Both attributes are assigned unconditionally on construction, so fixed slots are safe here and spare each cache
+    # instance its attribute "__dict__".
+    __slots__ = ('module_graph', '_hook_module_name_prefix')
+
     _cache_id_next = 0
     """
     0-based identifier unique to the next `ModuleHookCache` to be instantiated.
@@ -108,13 +127,33 @@ class ModuleHookCache(dict):
             if not os.path.isdir(hook_dir):
                 raise FileNotFoundError('Hook directory "{}" not found.'.format(hook_dir))
 
-            # For each hook script in this directory...
-            hook_filenames = glob.glob(os.path.join(hook_dir, 'hook-*.py'))
-            for hook_filename in hook_filenames:
-                # Fully-qualified name of this hook's corresponding module, constructed by removing the "hook-" prefix
-                # and ".py" suffix.
-                module_name = os.path.basename(hook_filename)[5:-3]
+            # Enumerate hook scripts in this directory, reusing the cached listing if this directory has not been
+            # modified since it was last enumerated.
+            dir_mtime_ns = os.stat(hook_dir).st_mtime_ns
+            cached_listing = _hook_dir_listing_cache.get(hook_dir)
+            if cached_listing is not None and cached_listing[0] == dir_mtime_ns:
+                hook_files = cached_listing[1]
+            else:
+                hook_files = {}
+                with os.scandir(hook_dir) as dir_entries:
+                    for dir_entry in dir_entries:
+                        hook_basename = dir_entry.name
+                        if not (
+                            hook_basename.startswith(_HOOK_FILE_PREFIX) and hook_basename.endswith(_HOOK_FILE_SUFFIX)
+                        ):
+                            continue
+                        if not dir_entry.is_file():
+                            continue
+                        # Fully-qualified name of this hook's corresponding module, constructed by removing the "hook-"
+                        # prefix and ".py" suffix. As the directory's path is absolute, so is the entry's path. The
+                        # name is interned, as it is subsequently used as a dictionary key and compared against graph
+                        # node identifiers throughout hook processing.
+                        module_name = sys.intern(hook_basename[_HOOK_FILE_PREFIX_LEN:-_HOOK_FILE_SUFFIX_LEN])
+                        hook_files[module_name] = dir_entry.path
+                _hook_dir_listing_cache[hook_dir] = (dir_mtime_ns, hook_files)
 
+            # For each hook script in this directory...
+            for module_name, hook_filename in hook_files.items():
                 # Lazily loadable hook object.
                 module_hook = ModuleHook(
                     module_graph=self.module_graph,
@@ -138,16 +177,17 @@ class ModuleHookCache(dict):
         """
 
         for module_name in module_names:
+            # Remove this module and its hook script objects from this cache with a single lookup.
+            module_hooks = self.pop(module_name, None)
+            if module_hooks is None:
+                continue
+
             # Unload this module's hook script modules from memory. Since these are top-level pure-Python modules cached
             # only in the "sys.modules" dictionary, popping these modules from this dictionary suffices to garbage
             # collect these modules.
-            module_hooks = self.get(module_name, [])
             for module_hook in module_hooks:
                 sys.modules.pop(module_hook.hook_module_name, None)
 
-            # Remove this module and its hook script objects from this cache.
-            self.pop(module_name, None)
-
 
 def _module_collection_mode_sanitizer(value):
     if isinstance(value, dict):
@@ -245,6 +285,12 @@ class ModuleHook:
         `_load_hook_module()` method _or_ `None` if this method has yet to be accessed.
     """
 
+    # NOTE: this class must NOT declare "__slots__", even though its attribute set is fixed. The cached module graph
+    # is deep-copied with live "ModuleHook" instances in it, and the default slot-based "__getstate__()" probes every
+    # slot with getattr(); probing an unset magic attribute would fall through to "__getattr__()" below and eagerly
+    # execute the hook script in the middle of the copy. The per-instance "__dict__" sidesteps that, as deep copies
+    # then only replicate attributes that have actually been set.
+
     #-- Magic --
 
     def __init__(self, module_graph, module_name, hook_filename, hook_module_name_prefix):
@@ -272,7 +318,9 @@ class ModuleHook:
         # ModuleHookCache.__init__(). TODO: Add a failure message
         assert isinstance(module_graph, weakref.ProxyTypes)
         self.module_graph = module_graph
-        self.module_name = module_name
+        # Intern the module name: it recurs as a dictionary key and in identifier comparisons across hook processing,
+        # which degrade to pointer comparisons for interned strings.
+        self.module_name = sys.intern(module_name)
         self.hook_filename = hook_filename
 
         # Name of the in-memory module fabricated to refer to this hook script.
@@ -388,14 +436,19 @@ class ModuleHook:
         # Mark as loaded
         self._loaded = True
 
+        # Snapshot the hook module's attribute dictionary. The hook module is never mutated after loading, so probing
+        # this dictionary directly is cheaper than repeated hasattr()/getattr() calls, each of which traverses the
+        # full attribute-lookup machinery.
+        hook_module_attrs = self._hook_module.__dict__
+
         # Check if module has hook() function.
-        self._has_hook_function = hasattr(self._hook_module, 'hook')
+        self._has_hook_function = 'hook' in hook_module_attrs
 
         # Copy hook script attributes into magic attributes exposed as instance variables of the current "ModuleHook"
         # instance.
         for attr_name, (default_type, sanitizer_func) in _MAGIC_MODULE_HOOK_ATTRS.items():
             # Unsanitized value of this attribute.
-            attr_value = getattr(self._hook_module, attr_name, None)
+            attr_value = hook_module_attrs.get(attr_name)
 
             # If this attribute is undefined, expose a sane default instead.
             if attr_value is None:
@@ -459,8 +512,9 @@ class ModuleHook:
             Analysis that calls the hook
         """
 
-        # If this hook script defines no hook() function, noop.
-        if not hasattr(self._hook_module, 'hook'):
+        # If this hook script defines no hook() function, noop. Attribute presence was snapshotted when the hook
+        # module was loaded, avoiding a repeated hasattr() probe here.
+        if not self._has_hook_function:
             return
 
         # Call this hook() function.
@@ -471,9 +525,10 @@ class ModuleHook:
             logger.debug("Hook failed with:", exc_info=True)
             raise ImportErrorWhenRunningHook(self.hook_module_name, self.hook_filename)
 
-        # Update all magic attributes modified by the prior call.
-        self.datas.update(set(hook_api._added_datas))
-        self.binaries.update(set(hook_api._added_binaries))
+        # Update all magic attributes modified by the prior call. The target attributes are already sets, so the added
+        # entries need not be materialized into intermediate sets first.
+        self.datas.update(hook_api._added_datas)
+        self.binaries.update(hook_api._added_binaries)
         self.hiddenimports.extend(hook_api._added_imports)
         self.module_collection_mode.update(hook_api._module_collection_mode)
 
@@ -496,12 +551,17 @@ class ModuleHook:
         by hook scripts.
         """
 
-        # For each hidden import required by the module being hooked...
-        for import_module_name in self.hiddenimports:
-            try:
-                # Graph node for this module. Do not implicitly create namespace packages for non-existent packages.
-                caller = self.module_graph.find_node(self.module_name, create_nspkg=False)
+        # Graph node for the hooked module, looked up once rather than per hidden import. Do not implicitly create
+        # namespace packages for non-existent packages.
+        caller = self.module_graph.find_node(self.module_name, create_nspkg=False)
 
+        # For each hidden import required by the module being hooked... Hooks occasionally list the same hidden import
+        # several times (e.g., when the attribute is assembled from multiple collect_submodules() calls), and each
+        # duplicate would cost a full import_hook() round trip through the graph machinery; process every name once,
+        # in the original order. The names are interned on the way, as they become graph node identifiers that are
+        # repeatedly hashed and compared downstream.
+        for import_module_name in dict.fromkeys(map(sys.intern, self.hiddenimports)):
+            try:
                 # Manually import this hidden import from this module.
                 self.module_graph.import_hook(import_module_name, caller)
             # If this hidden import is unimportable, print a non-fatal warning. Hidden imports often become
@@ -511,32 +571,39 @@ class ModuleHook:
                     logger.warning('Hidden import "%s" not found!', import_module_name)
 
 
+# Per-module entry in "AdditionalFilesCache", bundling the collected binaries and datas lists. Storing both lists in
+# a single record halves the number of dictionary entries (and lookups) compared to maintaining parallel
+# per-attribute dictionaries.
+_CachedAdditionalFiles = namedtuple('_CachedAdditionalFiles', ['binaries', 'datas'])
+
+
 class AdditionalFilesCache:
     """
     Cache for storing what binaries and datas were pushed by what modules when import hooks were processed.
     """
     def __init__(self):
-        self._binaries = {}
-        self._datas = {}
+        self._cache = {}
 
     def add(self, modname, binaries, datas):
-
-        self._binaries.setdefault(modname, [])
-        self._binaries[modname].extend(binaries or [])
-        self._datas.setdefault(modname, [])
-        self._datas[modname].extend(datas or [])
+        entry = self._cache.get(modname)
+        if entry is None:
+            entry = self._cache[modname] = _CachedAdditionalFiles([], [])
+        entry.binaries.extend(binaries or [])
+        entry.datas.extend(datas or [])
 
     def __contains__(self, name):
-        return name in self._binaries or name in self._datas
+        return name in self._cache
 
     def binaries(self, modname):
         """
         Return list of binaries for given module name.
         """
-        return self._binaries.get(modname, [])
+        entry = self._cache.get(modname)
+        return entry.binaries if entry is not None else []
 
     def datas(self, modname):
         """
         Return list of datas for given module name.
         """
-        return self._datas.get(modname, [])
+        entry = self._cache.get(modname)
+        return entry.datas if entry is not None else []
@@ -439,7 +439,8 @@ class PostGraphAPI:
 
         # Detect TOC 3-tuple list by checking the length of the first entry
         if binaries and len(binaries[0]) == 3:
-            self._added_binaries.extend(entry[:2] for entry in binaries)
+            # Build the 2-tuples directly instead of slicing, avoiding a slice object allocation per entry.
+            self._added_binaries.extend((entry[0], entry[1]) for entry in binaries)
         else:
             # NOTE: `format_binaries_and_datas` changes tuples from input format `(src_name, dest_name)` to output
             # format `(dest_name, src_name)`.
@@ -455,7 +456,8 @@ class PostGraphAPI:
 
         # Detect TOC 3-tuple list by checking the length of the first entry
         if datas and len(datas[0]) == 3:
-            self._added_datas.extend(entry[:2] for entry in datas)
+            # Build the 2-tuples directly instead of slicing, avoiding a slice object allocation per entry.
+            self._added_datas.extend((entry[0], entry[1]) for entry in datas)
         else:
             # NOTE: `format_binaries_and_datas` changes tuples from input format `(src_name, dest_name)` to output
             # format `(dest_name, src_name)`.